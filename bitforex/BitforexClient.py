@@ -1,11 +1,12 @@
 import asyncio
 import aiohttp
+import yarl
 import hmac
 import hashlib
 import ssl
 import logging
-import datetime
-import json
+import time
+import orjson
 from typing import List, Optional, Tuple
 
 from bitforex.BitforexException import BitforexException
@@ -16,16 +17,38 @@ from bitforex.Pair import Pair
 
 LOG = logging.getLogger(__name__)
 
+# request signing is fast only when sha256 is served by OpenSSL, warn when hashlib falls back to the builtin implementation
+if type(hashlib.sha256()).__module__ != '_hashlib':
+	LOG.warning("hashlib is not backed by OpenSSL, signing of REST requests will be slow.")
+
 class BitforexClient(object):
 	REST_API_URI = "https://api.bitforex.com/api/v1/"
+	SIGNATURE_PATH_PREFIX = b"/api/v1/"
+	# shared across requests, aiohttp copies the headers internally
+	JSON_BODY_HEADERS = {'Content-Type': 'application/json'}
 
 	def __init__(self, api_key : str = None, sec_key : str = None,
-	             api_trace_log : bool = False, ssl_context : ssl.SSLContext = None) -> None:
+	             api_trace_log : bool = False, ssl_context : ssl.SSLContext = None,
+	             request_timeout : aiohttp.ClientTimeout = None) -> None:
 		self.api_key = api_key
 		self.sec_key = sec_key
+		self._sec_key_bytes = sec_key.encode('utf-8') if sec_key is not None else None
+
+		# keyed HMAC state reused for every signature so that the key pads are not recomputed per request
+		self._hmac_template = hmac.new(self._sec_key_bytes, b'', 'sha256') if sec_key is not None else None
+		# resource -> encoded "/api/v1/<resource>?" prefix of the signed message
+		self._signature_prefixes = {}
+
 		self.api_trace_log = api_trace_log
 
+		if request_timeout is not None:
+			self.request_timeout = request_timeout
+		else:
+			self.request_timeout = aiohttp.ClientTimeout(total = 30, connect = 10, sock_read = 20)
+
 		self.rest_session = None
+		self._method_dispatch = None
+		self._base_url = yarl.URL(BitforexClient.REST_API_URI)
 
 		if ssl_context is not None:
 			self.ssl_context = ssl_context
@@ -185,16 +208,22 @@ class BitforexClient(object):
 				except Exception as e:
 					LOG.exception(f"Unrecoverable exception occurred while processing messages: {e}")
 					LOG.info("All websockets scheduled for shutdown")
-					for task in pending:
-						if not task.cancelled():
-							task.cancel()
+					for pending_task in pending:
+						pending_task.cancel()
 		else:
 			raise Exception("ERROR: There are no subscriptions to be started.")
 
 	async def close(self) -> None:
-		session = self._get_rest_session()
-		if session is not None:
-			await session.close()
+		if self.rest_session is not None:
+			await self.rest_session.close()
+			self.rest_session = None
+			self._method_dispatch = None
+
+	async def __aenter__(self) -> 'BitforexClient':
+		return self
+
+	async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+		await self.close()
 
 	async def _create_get(self, resource : str, params : dict = None, headers : dict = None, signed : bool = False) -> dict:
 		return await self._create_rest_call(enums.RestCallType.GET, resource, None, params, headers, signed)
@@ -216,29 +245,39 @@ class BitforexClient(object):
 				params['accessKey'] = self.api_key
 				params['signData'] = self._get_signature(resource, params, data)
 
-			if rest_call_type == enums.RestCallType.GET:
-				rest_call = self._get_rest_session().get(BitforexClient.REST_API_URI + resource, json = data, params = params, headers = headers, ssl = self.ssl_context)
-			elif rest_call_type == enums.RestCallType.POST:
-				rest_call = self._get_rest_session().post(BitforexClient.REST_API_URI + resource, json = data, params = params, headers = headers, ssl = self.ssl_context)
-			elif rest_call_type == enums.RestCallType.DELETE:
-				rest_call = self._get_rest_session().delete(BitforexClient.REST_API_URI + resource, json = data, params = params, headers = headers, ssl = self.ssl_context)
-			elif rest_call_type == enums.RestCallType.PUT:
-				rest_call = self._get_rest_session().put(BitforexClient.REST_API_URI + resource, json = data, params = params, headers = headers, ssl = self.ssl_context)
-			else:
+			if self._method_dispatch is None:
+				self._get_rest_session()
+
+			try:
+				rest_method = self._method_dispatch[rest_call_type]
+			except KeyError:
 				raise Exception(f"Unsupported REST call type {rest_call_type}.")
 
-			LOG.debug(f"> rest type [{rest_call_type.name}], resource [{resource}], params [{params}], headers [{headers}], data [{data}]")
+			if data is not None:
+				body = orjson.dumps(data)
+				headers = {**headers, **BitforexClient.JSON_BODY_HEADERS} if headers else BitforexClient.JSON_BODY_HEADERS
+			else:
+				body = None
+
+			rest_call = rest_method(self._base_url / resource, data = body, params = params, headers = headers)
+
+			if LOG.isEnabledFor(logging.DEBUG):
+				LOG.debug(f"> rest type [{rest_call_type.name}], resource [{resource}], params [{params}], headers [{headers}], data [{data}]")
 			async with rest_call as response:
 				status_code = response.status
-				response_body = await response.text()
+				response_body = await response.read()
 
-				LOG.debug(f"<: status [{status_code}], response [{response_body}]")
+				if LOG.isEnabledFor(logging.DEBUG):
+					LOG.debug(f"<: status [{status_code}], response [{response_body.decode('utf-8', 'replace')}]")
 
-				if str(status_code)[0] != '2':
-					raise BitforexException(f"<: status [{status_code}], response [{response_body}]")
+				if not 200 <= status_code < 300:
+					raise BitforexException(f"<: status [{status_code}], response [{response_body.decode('utf-8', 'replace')}]")
 
 				if len(response_body) > 0:
-					response_body = json.loads(response_body)
+					response_body = orjson.loads(response_body)
+				else:
+					# empty body is returned as an empty string as before
+					response_body = ""
 
 				return {
 					"status_code": status_code,
@@ -257,7 +296,17 @@ class BitforexClient(object):
 		else:
 			trace_configs = None
 
-		self.rest_session = aiohttp.ClientSession(trace_configs=trace_configs)
+		# the connector owns the ssl context and keeps TCP/TLS connections alive between the calls
+		connector = aiohttp.TCPConnector(limit = 64, limit_per_host = 32, keepalive_timeout = 75, ssl = self.ssl_context,
+		                                 enable_cleanup_closed = True)
+
+		self.rest_session = aiohttp.ClientSession(connector = connector, timeout = self.request_timeout, trace_configs = trace_configs)
+		self._method_dispatch = {
+			enums.RestCallType.GET: self.rest_session.get,
+			enums.RestCallType.POST: self.rest_session.post,
+			enums.RestCallType.DELETE: self.rest_session.delete,
+			enums.RestCallType.PUT: self.rest_session.put,
+		}
 
 		return self.rest_session
 
@@ -271,27 +320,33 @@ class BitforexClient(object):
 		return res
 
 	async def _on_request_start(session, trace_config_ctx, params) -> None:
-		LOG.debug(f"> Context: {trace_config_ctx}")
-		LOG.debug(f"> Params: {params}")
+		if LOG.isEnabledFor(logging.DEBUG):
+			LOG.debug(f"> Context: {trace_config_ctx}")
+			LOG.debug(f"> Params: {params}")
 
 	async def _on_request_end(session, trace_config_ctx, params) -> None:
-		LOG.debug(f"< Context: {trace_config_ctx}")
-		LOG.debug(f"< Params: {params}")
+		if LOG.isEnabledFor(logging.DEBUG):
+			LOG.debug(f"< Context: {trace_config_ctx}")
+			LOG.debug(f"< Params: {params}")
 
 	@staticmethod
 	def _get_current_timestamp_ms() -> int:
-		return int(datetime.datetime.now(tz = datetime.timezone.utc).timestamp() * 1000)
+		return time.time_ns() // 1_000_000
 
 	def _get_signature(self, resource : str, params : dict, data : dict) -> str:
-		params_string = ""
-		data_string = ""
+		# the keyed HMAC state is fed incrementally which is equivalent to signing the concatenated message
+		m = self._hmac_template.copy()
 
 		if params is not None:
-			params_string = '/api/v1/' + resource + '?'
-			params_string += '&'.join([f"{key}={val}" for key, val in sorted(params.items())])
+			prefix = self._signature_prefixes.get(resource)
+			if prefix is None:
+				prefix = BitforexClient.SIGNATURE_PATH_PREFIX + resource.encode('utf-8') + b'?'
+				self._signature_prefixes[resource] = prefix
+
+			# values are already stringified by _clean_request_params
+			m.update(prefix + '&'.join(map('='.join, sorted(params.items()))).encode('utf-8'))
 
 		if data is not None:
-			data_string = '&'.join(["{}={}".format(param[0], param[1]) for param in data])
+			m.update('&'.join(["{}={}".format(param[0], param[1]) for param in data]).encode('utf-8'))
 
-		m = hmac.new(self.sec_key.encode('utf-8'), (params_string+data_string).encode('utf-8'), hashlib.sha256)
 		return m.hexdigest()
\ No newline at end of file
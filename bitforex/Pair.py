@@ -1,10 +1,32 @@
 class Pair(object):
+	__slots__ = ('_base', '_quote', '_str')
+
 	def __init__(self, base : str, quote : str):
-		self.base = base
-		self.quote = quote
+		self._base = base
+		self._quote = quote
+
+		# pairs are immutable, hence the symbol representation is computed only once
+		self._str = f"coin-{quote.lower()}-{base.lower()}"
+
+	@property
+	def base(self) -> str:
+		return self._base
+
+	@property
+	def quote(self) -> str:
+		return self._quote
 
 	def __str__(self):
-		return f"coin-{self.quote.lower()}-{self.base.lower()}"
+		return self._str
 
 	def __repr__(self):
-		return self.__str__()
+		return self._str
+
+	def __eq__(self, other):
+		if not isinstance(other, Pair):
+			return NotImplemented
+
+		return self._str == other._str
+
+	def __hash__(self):
+		return hash(self._str)
@@ -12,5 +12,5 @@ class Timer(object):
 		self.start_tmstmp = time.time_ns()
 
 	def __exit__(self, type, value, traceback):
-		if self.active:
+		if self.active and LOG.isEnabledFor(logging.DEBUG):
 			LOG.debug(f'Timer {self.name} finished. Took {round((time.time_ns() - self.start_tmstmp) / 1000000, 3)} ms.')
\ No newline at end of file
@@ -1,8 +1,7 @@
 import websockets
-import json
+import orjson
 import logging
 import asyncio
-from abc import ABC, abstractmethod
 from typing import List, Callable, Any
 
 from bitforex.Pair import Pair
@@ -11,17 +10,17 @@ from bitforex.PeriodicChecker import PeriodicChecker
 
 LOG = logging.getLogger(__name__)
 
-class Subscription(ABC):
+class Subscription(object):
+	__slots__ = ('callbacks',)
+
 	def __init__(self, callbacks = None):
 		self.callbacks = callbacks
 
-	@abstractmethod
 	def get_channel_name(self) -> str:
-		pass
+		return self.CHANNEL_NAME
 
-	@abstractmethod
 	def get_params(self) -> dict:
-		pass
+		raise NotImplementedError()
 
 	async def initialize(self) -> None:
 		pass
@@ -30,8 +29,30 @@ class Subscription(ABC):
 		await self.process_callbacks(response)
 
 	async def process_callbacks(self, response : dict) -> None:
-		if self.callbacks is not None:
-			await asyncio.gather(*[asyncio.create_task(cb(response)) for cb in self.callbacks])
+		if not self.callbacks:
+			return
+
+		# callbacks can be either plain functions or coroutine functions, only the coroutines are awaited
+		if len(self.callbacks) == 1:
+			# a single callback is awaited directly to avoid scheduling overhead
+			result = self.callbacks[0](response)
+			if asyncio.iscoroutine(result):
+				await result
+		else:
+			coroutines = []
+			try:
+				for cb in self.callbacks:
+					result = cb(response)
+					if asyncio.iscoroutine(result):
+						coroutines.append(result)
+			except Exception:
+				# coroutines created before the failing callback would never be awaited otherwise
+				for coroutine in coroutines:
+					coroutine.close()
+				raise
+
+			if coroutines:
+				await asyncio.gather(*coroutines)
 
 
 class SubscriptionMgr(object):
@@ -43,6 +64,11 @@ class SubscriptionMgr(object):
 
 		self.subscriptions = subscriptions
 
+		# channel name -> subscription, the first subscription of a channel receives its messages
+		self._channel_map = {}
+		for subscription in subscriptions:
+			self._channel_map.setdefault(subscription.get_channel_name(), subscription)
+
 		self.ping_checker = PeriodicChecker(period_ms = 30 * 1000)
 
 	async def run(self) -> None:
@@ -56,15 +82,16 @@ class SubscriptionMgr(object):
 				async with websockets.connect(SubscriptionMgr.WEB_SOCKET_URI, ping_interval = None, ssl = self.ssl_context) as websocket:
 					subscription_message = self._create_subscription_message()
 					LOG.debug(f"> {subscription_message}")
-					await websocket.send(json.dumps(subscription_message))
+					await websocket.send(orjson.dumps(subscription_message).decode())
 
 					# start processing incoming messages
 					while True:
 						response = await websocket.recv()
-						LOG.debug(f"< {response}")
+						if LOG.isEnabledFor(logging.DEBUG):
+							LOG.debug(f"< {response}")
 
 						if response != "pong_p":
-							await self.process_message(json.loads(await websocket.recv()))
+							await self.process_message(orjson.loads(response))
 
 						if self.ping_checker.check():
 							LOG.debug(f"> ping_p")
@@ -87,21 +114,21 @@ class SubscriptionMgr(object):
 		return subscription_message
 
 	async def process_message(self, response : dict) -> None:
-		for subscription in self.subscriptions:
-			if subscription.get_channel_name() == response["event"]:
-				await subscription.process_message(response["data"])
-				break
+		subscription = self._channel_map.get(response["event"])
+		if subscription is not None:
+			await subscription.process_message(response["data"])
 
 class OrderBookSubscription(Subscription):
+	__slots__ = ('pair', 'depth')
+
+	CHANNEL_NAME = "depth10"
+
 	def __init__(self, pair : Pair, depth : str, callbacks : List[Callable[[dict], Any]] = None):
 		super().__init__(callbacks)
 
 		self.pair = pair
 		self.depth = depth
 
-	def get_channel_name(self):
-		return "depth10"
-
 	def get_params(self):
 		return {
 			"businessType": str(self.pair),
@@ -109,20 +136,25 @@ class OrderBookSubscription(Subscription):
 		}
 
 class Ticker24hSubscription(Subscription):
+	__slots__ = ('pair',)
+
+	CHANNEL_NAME = "ticker"
+
 	def __init__(self, pair : Pair, callbacks : List[Callable[[dict], Any]] = None):
 		super().__init__(callbacks)
 
 		self.pair = pair
 
-	def get_channel_name(self):
-		return "ticker"
-
 	def get_params(self):
 		return {
 			"businessType": str(self.pair)
 		}
 
 class TickerSubscription(Subscription):
+	__slots__ = ('pair', 'size', 'interval')
+
+	CHANNEL_NAME = "kline"
+
 	def __init__(self, pair : Pair, size : str, interval = enums.CandelstickInterval, callbacks : List[Callable[[dict], Any]] = None):
 		super().__init__(callbacks)
 
@@ -130,9 +162,6 @@ class TickerSubscription(Subscription):
 		self.size = size
 		self.interval = interval
 
-	def get_channel_name(self):
-		return "kline"
-
 	def get_params(self):
 		return {
 			"businessType": str(self.pair),
@@ -141,15 +170,16 @@ class TickerSubscription(Subscription):
 		}
 
 class TradeSubscription(Subscription):
+	__slots__ = ('pair', 'size')
+
+	CHANNEL_NAME = "trade"
+
 	def __init__(self, pair : Pair, size : str, callbacks: List[Callable[[dict], Any]] = None):
 		super().__init__(callbacks)
 
 		self.pair = pair
 		self.size = size
 
-	def get_channel_name(self):
-		return "trade"
-
 	def get_params(self):
 		return {
 			"businessType": str(self.pair),
@@ -1,7 +1,16 @@
 import asyncio
 import logging
 import os
-from datetime import datetime
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+# uvloop is an optional example-only dependency (pip install bitforex-aio[examples]), it is used when available,
+# otherwise (e.g. on Windows) the standard asyncio event loop is used
+try:
+	import uvloop
+	run_event_loop = uvloop.run
+except ImportError:
+	run_event_loop = asyncio.run
 
 from bitforex import enums
 from bitforex.BitforexClient import BitforexClient
@@ -10,91 +19,104 @@ from bitforex.subscriptions import OrderBookSubscription, TradeSubscription, Tic
 
 LOG = logging.getLogger("bitforex")
 LOG.setLevel(logging.DEBUG)
-LOG.addHandler(logging.StreamHandler())
 
-print(f"Available loggers: {[name for name in logging.root.manager.loggerDict]}\n")
+# records are written out by the listener thread so that stream I/O does not block the event loop
+log_queue = queue.Queue(-1)
+LOG.addHandler(QueueHandler(log_queue))
+log_listener = QueueListener(log_queue, logging.StreamHandler())
+log_listener.start()
+
+if __debug__ and LOG.isEnabledFor(logging.DEBUG):
+	LOG.debug("Available loggers: %s", list(logging.root.manager.loggerDict))
 
-async def trade_update(response : dict) -> None:
-	print(f"Callback trade_update: [{response}]")
+def trade_update(response : dict) -> None:
+	LOG.debug("Callback trade_update: [%s]", response)
 
-async def order_book_update(response : dict) -> None:
-	print(f"Callback order_book_update: [{response}]")
+def order_book_update(response : dict) -> None:
+	LOG.debug("Callback order_book_update: [%s]", response)
 
-async def ticker_update(response : dict) -> None:
-	print(f"Callback ticker_update: [{response}]")
+def ticker_update(response : dict) -> None:
+	LOG.debug("Callback ticker_update: [%s]", response)
 
 async def run():
 	print("STARTING BITFOREX CLIENT\n")
 
 	# to retrieve your API/SEC key go to your bitforex account, create the keys and store them in APIKEY/SECKEY
 	# environment variables
-	api_key = os.environ['BITFOREXAPIKEY']
-	sec_key = os.environ['BITFOREXSECKEY']
-
-	client = BitforexClient(api_key, sec_key)
-
-	# REST api calls
-	print("REST API")
-
-	print("\nExchange info:")
-	await client.get_exchange_info()
-
-	print("\nOrder book:")
-	await client.get_order_book(pair = Pair('ETH', 'BTC'), depth = "1")
-
-	print("\nTicker:")
-	await client.get_ticker(pair = Pair('ETH', 'BTC'))
-
-	print("\nSingle fund:")
-	await client.get_single_fund(currency = "NOBS")
-
-	print("\nFunds:")
-	await client.get_funds()
-
-	print("\nTrades:")
-	await client.get_trades(pair = Pair('ETH', 'BTC'), size = "1")
-
-	print("\nCandelsticks:")
-	await client.get_candlesticks(pair = Pair('ETH', 'BTC'), interval = enums.CandelstickInterval.I_1W, size = "5")
-
-	print("\nCreate order:")
-	await client.create_order(Pair("ETH", "BTC"), side = enums.OrderSide.SELL, quantity = "1", price = "1")
-
-	print("\nCreate multiple orders:")
-	await client.create_multi_order(Pair("ETH", "BTC"),
-	                                orders = [("1", "1", enums.OrderSide.SELL), ("2", "1", enums.OrderSide.SELL)])
-
-	print("\nCancel order:")
-	await client.cancel_order(pair = Pair('ETH', 'BTC'), order_id = "10")
-
-	print("\nCancel multiple orders:")
-	await client.cancel_multi_order(pair = Pair('ETH', 'BTC'), order_ids = ["10", "20"])
-
-	print("\nCancel all orders:")
-	await client.cancel_all_orders(pair = Pair('ETH', 'BTC'))
-
-	print("\nGet order:")
-	await client.get_order(pair = Pair('ETH', 'BTC'), order_id = "1")
-
-	print("\nGet orders:")
-	await client.get_orders(pair = Pair('ETH', 'BTC'), order_ids = ["1", "2"])
-
-	print("\nFind orders:")
-	await client.find_order(pair = Pair('ETH', 'BTC'), state = enums.OrderState.PENDING)
-
-	# Websockets
-	print("\nWEBSOCKETS\n")
-
-	# Bundle several subscriptions into a single websocket
-	client.compose_subscriptions([
-		OrderBookSubscription(pair = Pair('ETH', 'BTC'), depth = "0", callbacks = [order_book_update]),
-		TradeSubscription(pair = Pair('ETH', 'BTC'), size = "20", callbacks = [trade_update]),
-	])
-
-	# Execute all websockets asynchronously
-	await client.start_subscriptions()
-
-	await client.close()
+	env = os.environ
+	api_key, sec_key = env.get('BITFOREXAPIKEY'), env.get('BITFOREXSECKEY')
+	if api_key is None or sec_key is None:
+		raise SystemExit("BITFOREXAPIKEY and BITFOREXSECKEY environment variables must be set.")
+
+	# the REST session is closed when the block is left, including on an exception
+	async with BitforexClient(api_key, sec_key) as client:
+		# REST api calls
+		print("REST API")
+
+		# independent read-only calls are executed concurrently over the shared connection pool, a failure of one call
+		# is returned in place of its result and does not abort the others
+		exchange_info, order_book, ticker, trades, candlesticks = await asyncio.gather(
+			client.get_exchange_info(),
+			client.get_order_book(pair = Pair('ETH', 'BTC'), depth = "1"),
+			client.get_ticker(pair = Pair('ETH', 'BTC')),
+			client.get_trades(pair = Pair('ETH', 'BTC'), size = "1"),
+			client.get_candlesticks(pair = Pair('ETH', 'BTC'), interval = enums.CandelstickInterval.I_1W, size = "5"),
+			return_exceptions = True
+		)
+
+		print(f"\nExchange info: {exchange_info}")
+		print(f"\nOrder book: {order_book}")
+		print(f"\nTicker: {ticker}")
+		print(f"\nTrades: {trades}")
+		print(f"\nCandelsticks: {candlesticks}")
+
+		# signed calls carrying a millisecond nonce are kept sequential so that they do not race for the same nonce
+		print("\nSingle fund:")
+		await client.get_single_fund(currency = "NOBS")
+
+		print("\nFunds:")
+		await client.get_funds()
+
+		# order placement and cancellation is kept sequential
+		print("\nCreate order:")
+		await client.create_order(Pair("ETH", "BTC"), side = enums.OrderSide.SELL, quantity = "1", price = "1")
+
+		print("\nCreate multiple orders:")
+		await client.create_multi_order(Pair("ETH", "BTC"),
+		                                orders = [("1", "1", enums.OrderSide.SELL), ("2", "1", enums.OrderSide.SELL)])
+
+		print("\nCancel order:")
+		await client.cancel_order(pair = Pair('ETH', 'BTC'), order_id = "10")
+
+		print("\nCancel multiple orders:")
+		await client.cancel_multi_order(pair = Pair('ETH', 'BTC'), order_ids = ["10", "20"])
+
+		print("\nCancel all orders:")
+		await client.cancel_all_orders(pair = Pair('ETH', 'BTC'))
+
+		print("\nGet order:")
+		await client.get_order(pair = Pair('ETH', 'BTC'), order_id = "1")
+
+		print("\nGet orders:")
+		await client.get_orders(pair = Pair('ETH', 'BTC'), order_ids = ["1", "2"])
+
+		print("\nFind orders:")
+		await client.find_order(pair = Pair('ETH', 'BTC'), state = enums.OrderState.PENDING)
+
+		# Websockets
+		print("\nWEBSOCKETS\n")
+
+		# Bundle several subscriptions into a single websocket
+		client.compose_subscriptions([
+			OrderBookSubscription(pair = Pair('ETH', 'BTC'), depth = "0", callbacks = [order_book_update]),
+			TradeSubscription(pair = Pair('ETH', 'BTC'), size = "20", callbacks = [trade_update]),
+		])
+
+		# Execute all websockets asynchronously
+		await client.start_subscriptions()
 
 if __name__ == "__main__":
-	asyncio.run(run())
+	try:
+		run_event_loop(run())
+	finally:
+		log_listener.stop()